@@ -14,6 +14,49 @@ class AddrStr(str):
     """
 
 
+_Sections = tuple[str, Optional[str], Optional[str]]
+
+
+# Addresses built with add_instance/add_entry are registered here straight
+# from their parent's sections, so descendants share the parent's file and
+# entry strings rather than each holding their own copy
+_sections_cache: dict[str, _Sections] = {}
+
+
+def _split_sections(address: AddrStr) -> _Sections:
+    """
+    Split an address into its file, entry and instance sections.
+
+    The same addresses are picked apart many times over in a build,
+    so we only do the splitting once per address.
+    """
+    try:
+        return _sections_cache[address]
+    except KeyError:
+        sections = _sections_cache[address] = _scan_sections(address)
+        return sections
+
+
+def _scan_sections(address: AddrStr) -> _Sections:
+    """
+    Find the section boundaries with str.find, which scans in C,
+    and slice each section out exactly once.
+    """
+    file_end = address.find(":")
+    if file_end == -1:
+        return address, None, None
+
+    instance_sep = address.find("::", file_end + 1)
+    if instance_sep == -1:
+        return address[:file_end], address[file_end + 1:], None
+
+    return (
+        address[:file_end],
+        address[file_end + 1:instance_sep],
+        address[instance_sep + 2:],
+    )
+
+
 def get_file(address: AddrStr) -> str:
     """
     Extract the file path from an address.
@@ -25,48 +68,61 @@ def get_file(address: AddrStr) -> str:
     This is because an "empty" file path is a valid address,
     to the current working directory, which is confusing.
     """
-    return address.split(":")[0]
+    return _split_sections(address)[0]
 
 
 def get_relative_addr_str(address: AddrStr) -> AddrStr:
     """
     Extract the relative address starting with the .ato file
     """
-    return address.split("/")[-1]
+    return address.rpartition("/")[2]
 
 
 def get_entry(address: AddrStr) -> AddrStr:
     """
     Extract the root path from an address.
     """
-    return address.split("::")[0]
+    return address.partition("::")[0]
 
 
 def get_entry_section(address: AddrStr) -> Optional[str]:
     """
     Extract the root path from an address.
     """
-    try:
-        return address.split(":")[1]
-    except IndexError:
-        return None
+    return _split_sections(address)[1]
 
 
 def get_instance_section(address: AddrStr) -> Optional[str]:
     """
     Extract the node path from an address.
     """
-    try:
-        return address.split(":")[3]
-    except IndexError:
-        return None
+    return _split_sections(address)[2]
 
 
 def get_name(address: AddrStr) -> str:
     """
     Extract name from the end of the sequence.
     """
-    return address.split(":")[-1].split(".")[-1]
+    name_start = max(address.rfind(":"), address.rfind(".")) + 1
+    return address[name_start:]
+
+
+def _append_instance_path(address: AddrStr, instance_path: str) -> AddrStr:
+    """
+    Append a (possibly dotted) instance path to an address.
+    """
+    file, entry, instance_section = _split_sections(address)
+    if not instance_section:
+        new_address = address + "::" + instance_path
+        new_instance_section = instance_path
+    else:
+        new_address = address + "." + instance_path
+        new_instance_section = instance_section + "." + instance_path
+
+    # only register what a fresh scan of the new address would agree with
+    if entry is not None and instance_section != "":
+        _sections_cache[new_address] = (file, entry, new_instance_section)
+    return new_address
 
 
 def add_instance(address: AddrStr, instance: str) -> AddrStr:
@@ -74,11 +130,7 @@ def add_instance(address: AddrStr, instance: str) -> AddrStr:
     Add an instance to an address.
     """
     assert isinstance(instance, str)
-
-    if not get_instance_section(address):
-        return address + "::" + instance
-    else:
-        return address + "." + instance
+    return _append_instance_path(address, instance)
 
 
 def add_instances(address: AddrStr, instances: Iterable[str]) -> AddrStr:
@@ -86,24 +138,42 @@ def add_instances(address: AddrStr, instances: Iterable[str]) -> AddrStr:
     Add multiple instances to an address.
     """
     assert not isinstance(instances, str)
-    for instance in instances:
-        address = add_instance(address, instance)
-    return address
+    instances = tuple(instances)
+    if not instances:
+        return address
 
+    # the address is only inspected once, rather than once per instance added
+    assert all(isinstance(instance, str) for instance in instances)
+    return _append_instance_path(address, ".".join(instances))
 
-def add_entry(address: AddrStr, entry: str) -> AddrStr:
+
+def _append_entry_path(address: AddrStr, entry_path: str) -> AddrStr:
     """
-    Add an entry to an address.
+    Append a (possibly dotted) entry path to an address.
     """
-    assert isinstance(entry, str)
-
-    if get_instance_section(address):
+    file, entry_section, instance_section = _split_sections(address)
+    if instance_section:
         raise ValueError("Cannot add entry to an instance address.")
 
-    if not get_entry_section(address):
-        return address + ":" + entry
+    if not entry_section:
+        new_address = address + ":" + entry_path
+        new_entry_section = entry_path
     else:
-        return address + "." + entry
+        new_address = address + "." + entry_path
+        new_entry_section = entry_section + "." + entry_path
+
+    # only register what a fresh scan of the new address would agree with
+    if instance_section is None and entry_section != "":
+        _sections_cache[new_address] = (file, new_entry_section, None)
+    return new_address
+
+
+def add_entry(address: AddrStr, entry: str) -> AddrStr:
+    """
+    Add an entry to an address.
+    """
+    assert isinstance(entry, str)
+    return _append_entry_path(address, entry)
 
 
 def add_entries(address: AddrStr, entries: Iterable[str]) -> AddrStr:
@@ -111,9 +181,13 @@ def add_entries(address: AddrStr, entries: Iterable[str]) -> AddrStr:
     Add multiple entries to an address.
     """
     assert not isinstance(entries, str)
-    for entry in entries:
-        address = add_entry(address, entry)
-    return address
+    entries = tuple(entries)
+    if not entries:
+        return address
+
+    # the address is only inspected once, rather than once per entry added
+    assert all(isinstance(entry, str) for entry in entries)
+    return _append_entry_path(address, ".".join(entries))
 
 
 def from_parts(
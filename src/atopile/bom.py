@@ -3,19 +3,18 @@ This is a terminal target that will generate BoMs
 """
 
 import csv
-import itertools
 import logging
-from collections import OrderedDict
-from io import StringIO
+from collections import defaultdict
+from pathlib import Path
+from typing import Iterable, Optional
 
 import natsort
 import rich
 from rich.style import Style
 from rich.table import Table
-from toolz import groupby
 
 from atopile import address, errors, components
-from atopile.instance_methods import all_descendants, match_components
+from atopile.instance_methods import get_all_components
 
 log = logging.getLogger(__name__)
 
@@ -31,27 +30,45 @@ _get_footprint = errors.downgrade(
 )
 
 
+_get_user_facing_value = errors.downgrade(
+    components.get_user_facing_value,
+    (components.MissingData, components.NoMatchingComponent)
+)
+
+_get_specd_value = errors.downgrade(
+    components.get_specd_value, components.MissingData
+)
+
+
 def _get_value(addr: address.AddrStr) -> str:
-    value = errors.downgrade(
-        components.get_user_facing_value,
-        (components.MissingData, components.NoMatchingComponent)
-    )(addr)
+    value = _get_user_facing_value(addr)
 
     if value is not None:
         return value
 
-    value = str(errors.downgrade(
-        components.get_specd_value, components.MissingData
-    )(addr))
+    # NOTE: this is never None once it's been through str()
+    return str(_get_specd_value(addr))
+
+
+def _group_by_mpn(
+    all_components: Iterable[address.AddrStr],
+) -> dict[Optional[str], list[address.AddrStr]]:
+    """Group components by their MPN."""
+    components_by_mpn: dict[Optional[str], list[address.AddrStr]] = defaultdict(list)
+    for addr in all_components:
+        components_by_mpn[_get_mpn(addr)].append(addr)
+    return components_by_mpn
 
-    if value is not None:
-        return value
 
-    return "?"
+# Designators are unique, so we only need to derive a natural-sort key
+# from the designator itself, not from the whole (designator, name) row
+_natural_key = natsort.natsort_keygen()
 
 
 light_row = Style(color="bright_black")
 dark_row = Style(color="white")
+# Let rich alternate the row styles itself, rather than us working it out per row
+row_styles = [light_row, dark_row]
 
 
 def generate_designator_map(entry_addr: address.AddrStr) -> str:
@@ -60,116 +77,96 @@ def generate_designator_map(entry_addr: address.AddrStr) -> str:
     if address.get_instance_section(entry_addr):
         raise ValueError("Cannot generate a BoM for an instance address.")
 
-    all_components = list(filter(match_components, all_descendants(entry_addr)))
+    all_components = get_all_components(entry_addr)
 
     # Create tables to print to the terminal and to the disc
-    sorted_des_table = Table(show_header=True, header_style="bold green")
-    sorted_name_table = Table(show_header=True, header_style="bold green")
+    sorted_des_table = Table(
+        show_header=True, header_style="bold green", row_styles=row_styles
+    )
+    sorted_name_table = Table(
+        show_header=True, header_style="bold green", row_styles=row_styles
+    )
     sorted_des_table.add_column("Designator ↓", justify="right")
     sorted_des_table.add_column("Name", justify="left")
     sorted_name_table.add_column("Name ↓", justify="left")
     sorted_name_table.add_column("Designator", justify="left")
 
     # Populate the tables
-    sorted_designator_dict = {}
-    sorted_comp_name_dict = {}
-    for component in all_components:
-        c_des = components.get_designator(component)
-        c_name = address.get_instance_section(component)
-        sorted_designator_dict[c_des] = c_name
-        sorted_comp_name_dict[c_name] = c_des
-
-    sorted_designator_dict = OrderedDict(
-        natsort.natsorted(sorted_designator_dict.items())
-    )
-    sorted_comp_name_dict = OrderedDict(sorted(sorted_comp_name_dict.items()))
-
-    for row_index, (s_des, n_comp) in enumerate(sorted_designator_dict.items()):
-        sorted_des_table.add_row(
-            s_des, n_comp, style=dark_row if row_index % 2 else light_row
-        )
-    for row_index, (s_comp, n_des) in enumerate(sorted_comp_name_dict.items()):
-        sorted_name_table.add_row(
-            s_comp, n_des, style=dark_row if row_index % 2 else light_row
-        )
+    # NOTE: designators and instance names are both unique, so we can
+    # sort the (designator, name) pairs directly without deduplicating
+    get_designator = components.get_designator
+    get_instance_section = address.get_instance_section
+    designator_name_pairs = [
+        (get_designator(component), get_instance_section(component))
+        for component in all_components
+    ]
+
+    for s_des, n_comp in sorted(
+        designator_name_pairs, key=lambda pair: _natural_key(pair[0])
+    ):
+        sorted_des_table.add_row(s_des, n_comp)
+    for s_comp, n_des in sorted((name, des) for des, name in designator_name_pairs):
+        sorted_name_table.add_row(s_comp, n_des)
 
     # Print the table
     rich.print(sorted_des_table)
     rich.print(sorted_name_table)
 
 
-def generate_bom(entry_addr: address.AddrStr) -> str:
-    """Generate a BoM for the and print it to a CSV."""
+def generate_bom(entry_addr: address.AddrStr, path: Path) -> None:
+    """Generate a BoM for the and write it to a CSV."""
 
     if address.get_instance_section(entry_addr):
         raise ValueError("Cannot generate a BoM for an instance address.")
 
-    all_components = list(filter(match_components, all_descendants(entry_addr)))
-    bom = groupby(_get_mpn, all_components)
+    all_components = get_all_components(entry_addr)
+    bom = _group_by_mpn(all_components)
 
     # JLC format: Comment (whatever might be helpful) Designator Footprint LCSC
     COLUMNS = ["Comment", "Designator", "Footprint", "LCSC"]
 
-    # Create tables to print to the terminal and to the disc
-    console_table = Table(show_header=True, header_style="bold magenta")
-    for column in COLUMNS:
-        console_table.add_column(column)
-
-    csv_table = StringIO()
-    writer = csv.DictWriter(csv_table, fieldnames=COLUMNS)
-    writer.writeheader()
-
-    bom_row_nb_counter = itertools.count()
-
-    # Help to fill both tables
-    def _add_row(value, designator, footprint, mpn):
-        row_nb = next(bom_row_nb_counter)
-        writer.writerow(
-            {
-                "Comment": value,
-                "Designator": designator,
-                "Footprint": footprint,
-                "LCSC": mpn,
-            }
-        )
-        console_table.add_row(
-            value,
-            designator,
-            footprint,
-            mpn,
-            style=dark_row if row_nb % 2 else light_row,
-        )
-
-    # Populate the tables
+    # Populate the rows
+    # NOTE: each row must be in the same order as COLUMNS
+    rows: list[tuple[str, str, str, str]] = []
+    get_designator = components.get_designator
     for mpn, components_in_group in bom.items():
         if mpn:
             # representative component
             component = components_in_group[0]
 
-            friendly_designators = ",".join(
-                components.get_designator(component)
-                for component in components_in_group
-            )
+            friendly_designators = ",".join(map(get_designator, components_in_group))
 
-            _add_row(
+            rows.append((
                 _get_value(component),
                 friendly_designators,
                 _get_footprint(component),
                 mpn,
-            )
+            ))
         else:
             # for components without an MPN, we add a row for each component
             # this way the user can manually add the MPN as they see fit
             for component in components_in_group:
-                _add_row(
+                rows.append((
                     _get_value(component),
-                    components.get_designator(component),
+                    get_designator(component),
                     _get_footprint(component),
                     "?",
-                )
+                ))
 
     # Print the table
+    console_table = Table(
+        show_header=True, header_style="bold magenta", row_styles=row_styles
+    )
+    for column in COLUMNS:
+        console_table.add_column(column)
+    for row in rows:
+        console_table.add_row(*row)
     rich.print(console_table)
 
-    # Return the CSV
-    return csv_table.getvalue()
+    # Write the CSV straight to disc
+    # We only open the file once the rows are built, so a failed build
+    # doesn't truncate the previous output
+    with path.open("w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(COLUMNS)
+        writer.writerows(rows)
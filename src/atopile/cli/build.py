@@ -19,7 +19,7 @@ from atopile.errors import (
     muffle_fatalities,
 )
 from atopile.front_end import set_search_paths
-from atopile.netlist import get_netlist_as_str
+from atopile.netlist import write_netlist
 
 log = logging.getLogger(__name__)
 
@@ -114,15 +114,13 @@ def consolidate_footprints(build_args: BuildContext) -> None:
 @muster.register("netlist")
 def generate_netlist(build_args: BuildContext) -> None:
     """Generate a netlist for the project."""
-    with open(build_args.output_base.with_suffix(".net"), "w", encoding="utf-8") as f:
-        f.write(get_netlist_as_str(build_args.entry))
+    write_netlist(build_args.entry, build_args.output_base.with_suffix(".net"))
 
 
 @muster.register("bom")
 def generate_bom(build_args: BuildContext) -> None:
     """Generate a BOM for the project."""
-    with open(build_args.output_base.with_suffix(".csv"), "w", encoding="utf-8") as f:
-        f.write(atopile.bom.generate_bom(build_args.entry))
+    atopile.bom.generate_bom(build_args.entry, build_args.output_base.with_suffix(".csv"))
 
 
 @muster.register("designator-map")
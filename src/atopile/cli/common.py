@@ -56,7 +56,7 @@ def project_options(f):
             entry_arg_file_path = Path.cwd()
         else:
             entry_arg_file_path = (
-                Path(address.get_file(entry)).expanduser().resolve().absolute()
+                Path(address.get_file(entry)).expanduser().resolve()
             )
 
         try:
@@ -139,16 +139,23 @@ def check_compiler_versions(config: atopile.config.UserConfig):
     used to build the project.
     """
     with errors.handle_ato_errors():
+        # Only directories can hold a config of their own; every other path
+        # just resolves back to this project's config, so we skip them
         dependency_cfgs = (
             errors.downgrade(get_project_config_from_path, FileNotFoundError)(p)
             for p in Path(config.location).glob("*")
+            if p.is_dir()
         )
 
+        # Most of the project's top-level paths resolve back to the project's
+        # own (cached) config, so only check each distinct config once
+        checked_cfg_ids = set()
         for cltr, cfg in errors.iter_through_errors(
             itertools.chain([config], dependency_cfgs)
         ):
-            if cfg is None:
+            if cfg is None or id(cfg) in checked_cfg_ids:
                 continue
+            checked_cfg_ids.add(id(cfg))
 
             with cltr():
                 semver_str = cfg.ato_version
@@ -7,6 +7,7 @@ This CLI command provides the `ato install` command to:
 """
 
 import logging
+import os
 import subprocess
 from itertools import chain
 from pathlib import Path
@@ -102,7 +103,7 @@ def set_dependency_to_ato_yaml(top_level_path: Path, module_spec: str):
         raise errors.AtoError(f"ato.yaml not found in {top_level_path}")
 
     with ato_yaml_path.open("r") as file:
-        data = yaml.safe_load(file) or {}
+        data = yaml.load(file, Loader=config.YAML_LOADER) or {}
 
     # Add module to dependencies, avoiding duplicates
     dependencies: list[str] = data.setdefault("dependencies", [])
@@ -119,8 +120,18 @@ def set_dependency_to_ato_yaml(top_level_path: Path, module_spec: str):
     if module_spec not in dependencies:
         dependencies.append(module_spec)
 
-        with ato_yaml_path.open("w") as file:
-            yaml.safe_dump(data, file, default_flow_style=False)
+        # Dump the whole file up front, and swap it into place in one go,
+        # so the config is never left half-written
+        new_ato_yaml = yaml.dump(
+            data, Dumper=config.YAML_DUMPER, default_flow_style=False
+        )
+        tmp_ato_yaml_path = ato_yaml_path.with_name(ato_yaml_path.name + ".tmp")
+        try:
+            tmp_ato_yaml_path.write_text(new_ato_yaml, encoding="utf-8")
+            os.replace(tmp_ato_yaml_path, ato_yaml_path)
+        except BaseException:
+            tmp_ato_yaml_path.unlink(missing_ok=True)
+            raise
 
 
 def install_dependency(
@@ -1,6 +1,7 @@
 import logging
 from functools import cache
 from pathlib import Path
+from typing import Optional
 
 import pandas as pd
 import pint
@@ -38,7 +39,15 @@ _generics_to_db_fp_map = {
 
 _GENERIC_RESISTOR = "generic_resistor"
 _GENERIC_CAPACITOR = "generic_capacitor"
-_GENERICS_MPNS = [_GENERIC_RESISTOR, _GENERIC_CAPACITOR]
+_GENERICS_MPNS = frozenset((_GENERIC_RESISTOR, _GENERIC_CAPACITOR))
+
+
+def _is_generic_mpn(mpn) -> bool:
+    """
+    Return whether an MPN is one of the generics
+    """
+    # MPNs come straight from the users' data, which might not be hashable
+    return isinstance(mpn, str) and mpn in _GENERICS_MPNS
 
 
 _generic_to_type_map = {
@@ -69,8 +78,17 @@ def _is_generic(addr: AddrStr) -> bool:
     """
     Return whether a component is generic
     """
-    specd_mpn = _get_specd_mpn(addr)
-    return specd_mpn in _GENERICS_MPNS
+    return _is_generic_mpn(_get_specd_mpn(addr))
+
+
+# Building and converting pint quantities is expensive, and we do it for every
+# generic. There are only a few units in play, so we only ask pint once per pair
+@cache
+def _get_conversion_factor(from_unit: pint.Unit, to_unit: pint.Unit) -> float:
+    """
+    Return the factor to multiply a magnitude in from_unit by to get it in to_unit
+    """
+    return (1 * from_unit).to(to_unit).magnitude
 
 
 class NoMatchingComponent(errors.AtoError):
@@ -89,11 +107,7 @@ def _get_generic_from_db(component_addr: str) -> dict:
     specd_mpn = _get_specd_mpn(component_addr)
     specd_data = instance_methods.get_data_dict(component_addr)
 
-    df = _get_pandas_data()
-    filters = []
-
     specd_type = _generic_to_type_map[specd_mpn]
-    filters.append(f"type == '{specd_type}'")
 
     # Apply filters we know how to process
     try:
@@ -107,32 +121,68 @@ def _get_generic_from_db(component_addr: str) -> dict:
     # Ensure the component's value is completely contained within the specd value
     try:
         generic_unit = _generic_to_unit_map[specd_mpn]
-        min_float_val = (value_range.min_val * value_range.unit).to(generic_unit).magnitude
-        max_float_val = (value_range.max_val * value_range.unit).to(generic_unit).magnitude
+        conversion_factor = _get_conversion_factor(value_range.unit, generic_unit)
+        min_float_val = value_range.min_val * conversion_factor
+        max_float_val = value_range.max_val * conversion_factor
     except pint.DimensionalityError as ex:
         raise errors.AtoTypeError(
             f"{value_range.unit} cannot be converted to {generic_unit} for $addr", addr = component_addr,
             title="Invalid unit",
         ) from ex
 
-    filters.append(f"min_value >= {min_float_val}")
-    filters.append(f"max_value <= {max_float_val}")
-
     # Ensure the component's footprint is correct
-    try:
-        database_footprint = _generics_to_db_fp_map[specd_data['footprint']]
-    except KeyError as ex:
-        raise errors.AtoKeyError(f"Can't find generic part that matches'{specd_data['footprint']}' for $addr. Change the part's mpn or footprint.", addr=component_addr) from ex
+    specd_footprint = specd_data.get("footprint")
+    database_footprint = _generics_to_db_fp_map.get(specd_footprint)
+    if database_footprint is None:
+        raise errors.AtoKeyError(f"Can't find generic part that matches'{specd_footprint}' for $addr. Change the part's mpn or footprint.", addr=component_addr)
+
+    best_match = _query_generics_db(
+        specd_type, database_footprint, min_float_val, max_float_val
+    )
+    if best_match is None:
+        msg = "No component matching spec for $addr \n"
+        msg += "\n & ".join((
+            f"type == '{specd_type}'",
+            f"min_value >= {min_float_val}",
+            f"max_value <= {max_float_val}",
+            f"Package == '{database_footprint}'",
+        ))
+        raise NoMatchingComponent(msg, addr=component_addr)
+
+    return best_match
+
+
+@cache
+def _get_pandas_data_by_type_and_package() -> dict[tuple[str, str], pd.DataFrame]:
+    """
+    Return the generics db split up by part type and package.
+
+    Every query filters on exact type and package, so we split the table
+    once up front and each query only has to scan its own small slice.
+    """
+    return dict(iter(_get_pandas_data().groupby(["type", "Package"])))
 
-    filters.append(f"Package == '{database_footprint}'")
 
-    # Combine filters using reduce
-    combined_filter = " & ".join(filters)
-    filtered_df = df.query(combined_filter)
+# Many generics (eg. all the 100nF 0402 caps) share exactly the same spec,
+# so we cache the query on the spec rather than on the component
+@cache
+def _query_generics_db(
+    specd_type: str, package: str, min_value: float, max_value: float
+) -> Optional[dict]:
+    """
+    Return the cheapest part in the generics db matching the spec,
+    or None if there's nothing that matches
+    """
+    candidates_df = _get_pandas_data_by_type_and_package().get((specd_type, package))
+    if candidates_df is None:
+        return None
+
+    filtered_df = candidates_df[
+        (candidates_df["min_value"] >= min_value)
+        & (candidates_df["max_value"] <= max_value)
+    ]
     if filtered_df.empty:
-        msg = "No component matching spec for $addr \n"
-        msg += "\n & ".join(filters)
-        raise NoMatchingComponent(msg, addr=component_addr)
+        return None
 
     # FIXME: Currently our cost function is dumb - it only knows dollars
     # In the future this cost function should incorporate other things the user is
@@ -162,7 +212,7 @@ def get_mpn(addr: AddrStr) -> str:
     Return the MPN for a component
     """
     specd_mpn = _get_specd_mpn(addr)
-    if specd_mpn in _GENERICS_MPNS:
+    if _is_generic_mpn(specd_mpn):
         return _get_generic_from_db(addr)["LCSC Part #"]
 
     return specd_mpn
@@ -233,9 +283,7 @@ class DesignatorManager:
         used_designators = set()
 
         # first pass: grab all the designators from the lock data
-        for component in filter(
-            instance_methods.match_components, instance_methods.all_descendants(root)
-        ):
+        for component in instance_methods.get_all_components(root):
             designator = instance_methods.get_lock_data_dict(component).get(
                 "designator"
             )
@@ -246,14 +294,18 @@ class DesignatorManager:
                 unnamed_components.append(component)
 
         # second pass: assign designators to the unnamed components
+        # we remember where each prefix's search got to, since everything
+        # below it is already taken, rather than counting up from 1 each time
+        next_index_by_prefix: dict[str, int] = {}
         for component in unnamed_components:
             prefix = instance_methods.get_data_dict(component).get(
                 "designator_prefix", "U"
             )
 
-            i = 1
+            i = next_index_by_prefix.get(prefix, 1)
             while f"{prefix}{i}" in used_designators:
                 i += 1
+            next_index_by_prefix[prefix] = i + 1
 
             designators[component] = f"{prefix}{i}"
             used_designators.add(designators[component])
@@ -265,7 +317,10 @@ class DesignatorManager:
 
     def get_designator(self, addr: str) -> str:
         """Return a mapping of instance address to designator."""
-        if addr not in self._designators:
+        # Misses only happen once per entry, so optimise for the hit
+        try:
+            return self._designators[addr]
+        except KeyError:
             self._designators = self._make_designators(address.get_entry(addr))
         return self._designators[addr]
 
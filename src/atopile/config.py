@@ -4,6 +4,7 @@
 
 import collections.abc
 import fnmatch
+from functools import cache
 from pathlib import Path
 from typing import Any
 
@@ -19,6 +20,11 @@ ATO_DIR_NAME = ".ato"
 MODULE_DIR_NAME = "modules"
 BUILD_DIR_NAME = "build"
 
+# libyaml's C loader and dumper are much faster than the pure-python ones,
+# but PyYAML can be built without them
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 @define
 class UserPaths:
@@ -84,9 +90,9 @@ def make_config(project_config: Path) -> UserConfig:
     structure = UserConfig()
 
     with project_config.open() as f:
-        config_data = yaml.safe_load(f)
+        config_data = yaml.load(f, Loader=YAML_LOADER)
 
-    structure.location = project_config.parent.expanduser().resolve().absolute()
+    structure.location = project_config.parent.expanduser().resolve()
 
     return OmegaConf.merge(
         OmegaConf.structured(structure),  # structure
@@ -98,12 +104,18 @@ def get_project_dir_from_path(path: Path) -> Path:
     """
     Resolve the project directory from the specified path.
     """
-    for p in [path] + list(path.parents):
-        clean_path = p.resolve().absolute()
-        if (clean_path / CONFIG_FILENAME).exists():
-            return clean_path
+    # resolve before hitting the cache, so a relative path can't go stale
+    # if the cwd changes, and so we don't resolve once per parent
+    return _get_project_dir_from_resolved_path(path.resolve())
+
+
+@cache
+def _get_project_dir_from_resolved_path(clean_path: Path) -> Path:
+    for p in (clean_path, *clean_path.parents):
+        if (p / CONFIG_FILENAME).exists():
+            return p
     raise FileNotFoundError(
-        f"Could not find {CONFIG_FILENAME} in {path} or any parents"
+        f"Could not find {CONFIG_FILENAME} in {clean_path} or any parents"
     )
 
 
@@ -141,12 +153,13 @@ class ProjectContext:
     @classmethod
     def from_config(cls, config: UserConfig) -> "ProjectContext":
         """Create a BuildArgs object from a Config object."""
+        project_path = Path(config.location)
 
         return ProjectContext(
-            layout_path=Path(config.location) / config.paths.layout,
-            project_path=Path(config.location),
-            src_path=Path(config.location) / config.paths.src,
-            module_path=Path(config.location) / ATO_DIR_NAME / MODULE_DIR_NAME,
+            layout_path=project_path / config.paths.layout,
+            project_path=project_path,
+            src_path=project_path / config.paths.src,
+            module_path=project_path / ATO_DIR_NAME / MODULE_DIR_NAME,
         )
 
     @classmethod
@@ -199,11 +212,13 @@ class BuildContext:
                 f"Available builds: {list(config.builds.keys())}"
             ) from ex
 
-        abs_entry = address.AddrStr(config.location / build_config.entry)
+        project_path = Path(config.location)
+
+        abs_entry = address.AddrStr(project_path / build_config.entry)
 
-        build_path = Path(config.location) / BUILD_DIR_NAME
+        build_path = project_path / BUILD_DIR_NAME
 
-        layout_base = config.location / config.paths.layout / build_name
+        layout_base = project_path / config.paths.layout / build_name
         if layout_base.with_suffix(".kicad_pcb").exists():
             layout_path = layout_base.with_suffix(".kicad_pcb")
         elif layout_base.is_dir():
@@ -230,9 +245,9 @@ class BuildContext:
             entry=abs_entry,
             targets=build_config.targets,
             layout_path=layout_path,
-            project_path=Path(config.location),
-            src_path=Path(config.location) / config.paths.src,
-            module_path=Path(config.location) / ATO_DIR_NAME / MODULE_DIR_NAME,
+            project_path=project_path,
+            src_path=project_path / config.paths.src,
+            module_path=project_path / ATO_DIR_NAME / MODULE_DIR_NAME,
             build_path=build_path,
             output_base=build_path / build_name,
         )
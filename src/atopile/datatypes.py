@@ -11,6 +11,9 @@ log.setLevel(logging.INFO)
 class Ref(tuple[str]):
     """Shell class to provide basic utils for a reference."""
 
+    # There are a lot of these, and they don't need a __dict__
+    __slots__ = ()
+
     def add_name(self, name: str | int) -> "Ref":
         """Return a new Ref with the given name."""
         return Ref((*self, name))
@@ -253,6 +253,50 @@ def muffle_fatalities(func):
     return wrapper
 
 
+class _ErrorCollector:
+    """
+    Calling this returns a context manager which collects the errors raised
+    within it into the given list.
+
+    NOTE: this is entered for every item iter_through_errors yields, so it's
+    a plain class rather than a @contextmanager generator, which is far more
+    expensive to set up and tear down when nothing goes wrong.
+    """
+
+    __slots__ = ("errors", "accumulate_types")
+
+    def __init__(self, errors: list[Exception], accumulate_types: Type | tuple[Type]):
+        self.errors = errors
+        self.accumulate_types = accumulate_types
+
+    def __call__(self) -> "_ErrorCollector":
+        return self
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, exc_type, ex, tb) -> bool:
+        # If in a debugging session - don't collect errors
+        # because we want to see the unadulterated exception
+        # to stop the debugger
+        if ex is None or in_debug_session():
+            return False
+
+        if isinstance(ex, self.accumulate_types):
+            self.errors.append(ex)
+            return True
+
+        if isinstance(ex, ExceptionGroup):
+            nice, naughty = ex.split(self.accumulate_types)
+            if nice:
+                self.errors.extend(nice.exceptions)
+            if naughty:
+                raise naughty from ex
+            return True
+
+        return False
+
+
 @contextmanager
 def _error_accumulator(
     accumulate_types: Optional[Type | tuple[Type]] = None,
@@ -276,27 +320,7 @@ def _error_accumulator(
     if not group_message:
         group_message = ""
 
-    @contextmanager
-    def _collect_ato_errors():
-        # If in a debugging session - don't collect errors
-        # because we want to see the unadulterated exception
-        # to stop the debugger
-        if in_debug_session():
-            yield
-            return
-
-        try:
-            yield
-        except accumulate_types as ex:
-            errors.append(ex)
-        except ExceptionGroup as ex:
-            nice, naughty = ex.split(accumulate_types)
-            if nice:
-                errors.extend(nice.exceptions)
-            if naughty:
-                raise naughty from ex
-
-    yield _collect_ato_errors
+    yield _ErrorCollector(errors, accumulate_types)
 
     if errors:
         # Display unique errors in order
@@ -352,14 +376,16 @@ def downgrade(
         try:
             return func(*args, **kwargs)
         except exs as ex:
-            logger.log(
-                to_level,
-                format_error(
-                    ex,
-                    logger.isEnabledFor(logging.DEBUG)
-                ),
-                extra={"markup": True}
-            )
+            # formatting the error isn't free, so skip it if no-one's listening
+            if logger.isEnabledFor(to_level):
+                logger.log(
+                    to_level,
+                    format_error(
+                        ex,
+                        logger.isEnabledFor(logging.DEBUG)
+                    ),
+                    extra={"markup": True}
+                )
             if isinstance(default, collections.abc.Callable):
                 return default(*args, *kwargs)
             return default
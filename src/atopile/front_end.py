@@ -4,11 +4,12 @@ but doesn't resolve names of things.
 In building this datamodel, we check for name collisions, but we don't resolve them yet.
 """
 import enum
-from collections import ChainMap
+import sys
 from contextlib import ExitStack, contextmanager
+from functools import cache
 from itertools import chain
 from pathlib import Path
-from typing import Any, Callable, Iterable, Mapping, Optional
+from typing import Any, Callable, Iterable, Iterator, Mapping, Optional
 
 import pint
 from antlr4 import ParserRuleContext
@@ -17,7 +18,6 @@ from attrs import define, field, resolve_types
 from atopile import address, errors
 from atopile.address import AddrStr
 from atopile.datatypes import KeyOptItem, KeyOptMap, Ref
-from atopile.generic_methods import recurse
 from atopile.parse import parser
 from atopile.parse_utils import get_src_info_from_ctx
 from atopile.parser.AtopileParser import AtopileParser
@@ -25,14 +25,14 @@ from atopile.parser.AtopileParser import AtopileParser as ap
 from atopile.parser.AtopileParserVisitor import AtopileParserVisitor
 
 
-@define
+@define(weakref_slot=False)
 class Base:
     """Represent a base class for all things."""
 
     src_ctx: Optional[ParserRuleContext] = field(kw_only=True, default=None)
 
 
-@define
+@define(frozen=True, weakref_slot=False)
 class Import(Base):
     """Represent an import statement."""
 
@@ -42,14 +42,14 @@ class Import(Base):
         return f"<Import {self.obj_addr}>"
 
 
-@define
+@define(frozen=True, weakref_slot=False)
 class Replacement(Base):
     """Represent a replacement statement."""
 
     new_super_ref: Ref
 
 
-@define(repr=False)
+@define(repr=False, weakref_slot=False)
 class ObjectDef(Base):
     """
     Represent the definition or skeleton of an object
@@ -75,7 +75,7 @@ class ObjectDef(Base):
         return f"<{self.__class__.__name__} {self.address}>"
 
 
-@define
+@define(weakref_slot=False)
 class Physical(Base):
     """Let's get physical!"""
     unit: pint.Unit
@@ -101,7 +101,22 @@ class Physical(Base):
         return f"<{self.__class__.__name__} {self.min_val} to {self.max_val} {self.unit}>"
 
 
-@define(repr=False)
+# one bit per built-in, so checking what an instance is is a single AND
+BUILTIN_KIND_BITS = {
+    AddrStr(addr): 1 << i
+    for i, addr in enumerate(
+        (
+            "<Built-in>:Module",
+            "<Built-in>:Component",
+            "<Built-in>:Pin",
+            "<Built-in>:Signal",
+            "<Built-in>:Interface",
+        )
+    )
+}
+
+
+@define(repr=False, weakref_slot=False)
 class ObjectLayer(Base):
     """
     Represent a layer in the object hierarchy.
@@ -120,12 +135,27 @@ class ObjectLayer(Base):
     # objs: Optional[Mapping[str, "Object"]] = None
     data: Optional[Mapping[str, Any]] = None
 
+    # this layer and everything it inherits from, nearest first
+    # a layer's supers never change, so this is worked out once it's made
+    supers: tuple["ObjectLayer", ...] = field(init=False)
+
+    # bits of the built-ins in supers, worked out alongside them
+    kind_mask: int = field(init=False)
+
+    # copied from the obj_def, since it's read constantly when matching instances
+    address: AddrStr = field(init=False)
+
     # data from the lock-file entry associated with this object
     # lock_data: Mapping[str, Any] = {}  # TODO: this should point to a lockfile entry
 
-    @property
-    def address(self) -> AddrStr:
-        return self.obj_def.address
+    def __attrs_post_init__(self) -> None:
+        self.address = self.obj_def.address
+        self.kind_mask = BUILTIN_KIND_BITS.get(self.address, 0)
+        if self.super is None:
+            self.supers = (self,)
+        else:
+            self.supers = (self,) + self.super.supers
+            self.kind_mask |= self.super.kind_mask
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} {self.obj_def.address}>"
@@ -137,7 +167,7 @@ resolve_types(ObjectLayer)
 ## The below datastructures are created from the above datamodel as a second stage
 
 
-@define
+@define(weakref_slot=False)
 class Link(Base):
     """Represent a connection between two connectable things."""
 
@@ -156,7 +186,7 @@ class Link(Base):
         return f"<Link {repr(self.source)} -> {repr(self.target)}>"
 
 
-@define
+@define(weakref_slot=False)
 class Instance(Base):
     """
     Represents the specific instance, capturing, the story you told of
@@ -167,16 +197,18 @@ class Instance(Base):
     # much of this information is redundant, however it's all highly referenced
     # so it's useful to have it all at hand
     addr: AddrStr
-    supers: list["ObjectLayer"] = field(factory=list)
+    supers: tuple["ObjectLayer", ...] = ()
     children: dict[str, "Instance"] = field(factory=dict)
     links: list[Link] = field(factory=list)
 
-    data: Optional[
-        Mapping[str, Any]
-    ] = None  # this is a chainmap inheriting from the supers as well
+    # a bit (from BUILTIN_KIND_BITS) for each built-in this is an instance of
+    kind_mask: int = 0
+
+    # the supers' data flattened together, with the overrides on top
+    # overrides must be written to both this and override_data
+    data: Optional[dict[str, Any]] = None
 
     override_data: dict[str, Any] = field(factory=dict)
-    _override_location: dict[str, ObjectLayer] = field(factory=dict)
 
     # TODO: for later
     # lock_data: Optional[Mapping[str, Any]] = None
@@ -242,17 +274,73 @@ BUILTINS_BY_ADDR = {
 }
 
 
+_BUILTIN_ADDR_BY_REF = {ref: obj.address for ref, obj in BUILTINS_BY_REF.items()}
+
+
+# The same handful of units are used over and over again, and pint's
+# unit parsing is far more expensive than a dict lookup
+_parse_unit = cache(pint.Unit)
+
+# most numbers in a design have no units, so share the one unit object between them
+_DIMENSIONLESS = _parse_unit("")
+
+
 def _get_unit_from_ctx(ctx: ParserRuleContext) -> pint.Unit:
     """Return a pint unit from a context."""
     unit_str = ctx.getText()
     try:
-        return pint.Unit(unit_str)
+        return _parse_unit(unit_str)
     except pint.UndefinedUnitError as ex:
         raise errors.AtoUnknownUnitError.from_ctx(
             ctx, f"Unknown unit '{unit_str}'"
         ) from ex
 
 
+def _simple_stmt_kind(ctx: ap.Simple_stmtContext) -> Optional[type]:
+    """
+    Return the context type of the statement within a simple_stmt.
+    A simple_stmt wraps exactly one statement, so this is cheaper than probing
+    each of the generated accessors in turn, which each scan the children.
+    """
+    if ctx.children:
+        return type(ctx.children[0])
+    return None
+
+
+def _iter_block_stmts(
+    ctx: ap.BlockContext | ap.File_inputContext,
+) -> Iterator[ap.Simple_stmtContext | ap.Compound_stmtContext]:
+    """Yield the simple and compound statements within a block or file, in order."""
+    if isinstance(ctx, ap.BlockContext) and not ctx.stmt():
+        if not ctx.simple_stmts():
+            raise ValueError  # this should be protected because it shouldn't be parseable
+        yield from ctx.simple_stmts().simple_stmt()
+        return
+
+    for stmt in ctx.stmt():
+        if simple_stmts := stmt.simple_stmts():
+            yield from simple_stmts.simple_stmt()
+        elif compound_stmt := stmt.compound_stmt():
+            yield compound_stmt
+        else:
+            raise TypeError("Unexpected statement type")
+
+
+def _extend_results(
+    results: list[KeyOptItem], child_result: Iterable[_Sentinel | KeyOptItem] | _Sentinel
+) -> None:
+    """Add a child's results to the list, discarding anything that's NOTHING."""
+    if child_result is NOTHING:
+        return
+
+    for item in child_result:
+        if item is NOTHING:
+            continue
+        if not isinstance(item, KeyOptItem):
+            item = KeyOptItem(item)
+        results.append(item)
+
+
 class BaseTranslator(AtopileParserVisitor):
     """
     Dizzy is responsible for mixing cement, sand, aggregate, and water to create concrete.
@@ -262,8 +350,38 @@ class BaseTranslator(AtopileParserVisitor):
     def __init__(
         self,
     ) -> None:
+        # visit() is on the hot path of every translator, so rather than going
+        # through the context's accept() and a getattr each time, we resolve
+        # the visit method once per context type and keep hold of it
+        self._visit_methods: dict[type, Callable[[ParserRuleContext], Any]] = {}
+        # getText() re-joins a context's tokens on every call, and the same
+        # names get visited again for every instance made from their block
+        self._name_texts: dict[ap.NameContext, str] = {}
         super().__init__()
 
+    def visit(self, tree):
+        """Visit a parse tree, dispatching to the matching visitXxx method."""
+        try:
+            visit_method = self._visit_methods[type(tree)]
+        except KeyError:
+            visit_method = self._visit_methods[type(tree)] = self._get_visit_method(
+                type(tree)
+            )
+        return visit_method(tree)
+
+    def _get_visit_method(
+        self, tree_type: type
+    ) -> Callable[[ParserRuleContext], Any]:
+        """Resolve the method a tree of this type dispatches to in its accept()."""
+        type_name = tree_type.__name__
+        if issubclass(tree_type, ParserRuleContext) and type_name.endswith("Context"):
+            visit_method = getattr(self, "visit" + type_name[: -len("Context")], None)
+            if visit_method is not None:
+                return visit_method
+
+        # eg. terminal nodes, which have their own accept() logic
+        return lambda tree: tree.accept(self)
+
     def defaultResult(self):
         """
         Override the default "None" return type
@@ -277,19 +395,32 @@ class BaseTranslator(AtopileParserVisitor):
         discard any results that are NOTHING and flattening the children's results.
         It is assumed the children are returning their own OptionallyNamedItems.
         """
+        child_results = []
+        for err_cltr, child in errors.iter_through_errors(children):
+            with err_cltr():
+                _extend_results(child_results, self.visit(child))
 
-        def __visit() -> KeyOptMap:
-            for err_cltr, child in errors.iter_through_errors(children):
-                with err_cltr():
-                    child_result = self.visit(child)
-                    if child_result is not NOTHING:
-                        yield child_result
+        return KeyOptMap(child_results)
 
-        child_results = chain.from_iterable(__visit())
-        child_results = list(item for item in child_results if item is not NOTHING)
-        child_results = KeyOptMap(KeyOptItem(cr) for cr in child_results)
+    def _name_ref(self, ctx: ap.NameContext | ap.Totally_an_integerContext) -> Ref:
+        return Ref.from_one(str(self.visit(ctx)))
 
-        return KeyOptMap(child_results)
+    def _numerical_pin_ref(self, ctx: ap.Numerical_pin_refContext) -> Ref:
+        name_part = self.visit_ref_helper(ctx.name_or_attr())
+        return name_part.add_name(str(self.visit(ctx)))
+
+    def _attr_ref(self, ctx: ap.AttrContext | ap.Name_or_attrContext) -> Ref:
+        # these already visit to a Ref of names
+        return self.visit(ctx)
+
+    # keyed on the exact context type, so dispatch is a single dict lookup
+    _ref_handlers: dict[type, Callable[["BaseTranslator", Any], Ref]] = {
+        ap.NameContext: _name_ref,
+        ap.Totally_an_integerContext: _name_ref,
+        ap.Numerical_pin_refContext: _numerical_pin_ref,
+        ap.AttrContext: _attr_ref,
+        ap.Name_or_attrContext: _attr_ref,
+    }
 
     def visit_ref_helper(
         self,
@@ -301,31 +432,26 @@ class BaseTranslator(AtopileParserVisitor):
         """
         Visit any referencey thing and ensure it's returned as a reference
         """
-        if isinstance(
-            ctx,
-            (
-                ap.NameContext,
-                ap.Totally_an_integerContext,
-            ),
-        ):
-            return Ref.from_one(str(self.visit(ctx)))
-        if isinstance(ctx, ap.Numerical_pin_refContext):
-            name_part = self.visit_ref_helper(ctx.name_or_attr())
-            return name_part.add_name(str(self.visit(ctx)))
-        if isinstance(ctx, (ap.AttrContext, ap.Name_or_attrContext)):
-            return Ref(
-                map(str, self.visit(ctx)),
-            )
-        raise errors.AtoError(f"Unknown reference type: {type(ctx)}")
+        try:
+            handler = self._ref_handlers[type(ctx)]
+        except KeyError:
+            raise errors.AtoError(f"Unknown reference type: {type(ctx)}") from None
+        return handler(self, ctx)
 
     def visitName(self, ctx: ap.NameContext) -> str:
         """
         If this is an int, convert it to one (for pins), else return the name as a string.
         """
-        return ctx.getText()
+        try:
+            return self._name_texts[ctx]
+        except KeyError:
+            # Names are used over and over again as parts of refs and dict keys,
+            # so share one string per name and let comparisons short-circuit
+            text = self._name_texts[ctx] = sys.intern(ctx.getText())
+            return text
 
     def visitAttr(self, ctx: ap.AttrContext) -> Ref:
-        return Ref(self.visitName(name) for name in ctx.name())
+        return Ref([self.visitName(name) for name in ctx.name()])
 
     def visitName_or_attr(self, ctx: ap.Name_or_attrContext) -> Ref:
         if ctx.name():
@@ -349,9 +475,11 @@ class BaseTranslator(AtopileParserVisitor):
         This is practically here as a development shim to assert the result is as intended
         """
         result = self.visitChildren(ctx)
-        for item in result:
-            if item is not NOTHING:
-                assert isinstance(item, KeyOptItem)
+        # NOTE: gated, because the loop itself still runs even when asserts are stripped
+        if __debug__:
+            for item in result:
+                if item is not NOTHING:
+                    assert isinstance(item, KeyOptItem)
         return result
 
     def visitStmt(self, ctx: ap.StmtContext) -> KeyOptMap:
@@ -375,12 +503,27 @@ class BaseTranslator(AtopileParserVisitor):
     def visitSimple_stmts(self, ctx: ap.Simple_stmtsContext) -> KeyOptMap:
         return self.visit_iterable_helper(ctx.simple_stmt())
 
-    def visitBlock(self, ctx) -> KeyOptMap:
-        if ctx.stmt():
-            return self.visit_iterable_helper(ctx.stmt())
-        if ctx.simple_stmts():
-            return self.visitSimple_stmts(ctx.simple_stmts())
-        raise ValueError  # this should be protected because it shouldn't be parseable
+    def visitBlock(self, ctx: ap.BlockContext | ap.File_inputContext) -> KeyOptMap:
+        """
+        Visit all the statements in a block (or file).
+
+        This is equivalent to visiting each stmt and simple_stmts, but goes
+        straight to the statements themselves rather than through visit()
+        and visit_iterable_helper() for each layer in between.
+        """
+        child_results = []
+        for err_cltr, child in errors.iter_through_errors(_iter_block_stmts(ctx)):
+            with err_cltr():
+                if type(child) is ap.Simple_stmtContext:
+                    _extend_results(child_results, self.visitSimple_stmt(child))
+                    continue
+
+                item = self.visit(child)
+                if item is not NOTHING:
+                    assert isinstance(item, KeyOptItem)
+                    child_results.append(item)
+
+        return KeyOptMap(child_results)
 
     def visitImplicit_quantity(self, ctx: AtopileParser.Implicit_quantityContext) -> Physical:
         """Yield a physical value from an implicit quantity context."""
@@ -389,7 +532,7 @@ class BaseTranslator(AtopileParserVisitor):
         if ctx.name():
             unit = _get_unit_from_ctx(ctx.name())
         else:
-            unit = pint.Unit("")
+            unit = _DIMENSIONLESS
 
         return Physical(
             src_ctx=ctx,
@@ -405,7 +548,7 @@ class BaseTranslator(AtopileParserVisitor):
         if ctx.bilateral_nominal().name():
             unit = _get_unit_from_ctx(ctx.bilateral_nominal().name())
         else:
-            unit = pint.Unit("")
+            unit = _DIMENSIONLESS
 
         tol_ctx: AtopileParser.Bilateral_toleranceContext = ctx.bilateral_tolerance()
         tol_num = float(tol_ctx.NUMBER().getText())
@@ -470,7 +613,7 @@ class BaseTranslator(AtopileParserVisitor):
         end_val, end_unit = _parse_end(ctx.quantity_end(1))
 
         if start_unit is None and end_unit is None:
-            unit = pint.Unit("")
+            unit = _DIMENSIONLESS
         elif start_unit and end_unit:
             unit = start_unit
             try:
@@ -527,6 +670,13 @@ class BaseTranslator(AtopileParserVisitor):
             )
 
 
+def _make_search_paths(search_paths: Iterable[Path | str]) -> tuple[Path, ...]:
+    """
+    Normalise the search paths once, up front, rather than on every import.
+    """
+    return tuple(Path(search_path).resolve() for search_path in search_paths)
+
+
 class Scoop(BaseTranslator):
     """Scoop's job is to map out all the object definitions in the code."""
 
@@ -536,19 +686,35 @@ class Scoop(BaseTranslator):
         search_paths: Iterable[Path | str],
     ) -> None:
         self.ast_getter = ast_getter
-        self.search_paths = search_paths
+        self.search_paths = _make_search_paths(search_paths)
         self._output_cache: dict[AddrStr, ObjectDef] = {}
+        self._import_resolve_cache: dict[tuple[str, str], Path] = {}
         super().__init__()
 
+    def set_search_paths(self, search_paths: Iterable[Path | str]) -> None:
+        """
+        Rebind the search paths on this (long-lived) translator.
+        Cached import resolutions are dropped if the paths change.
+        """
+        search_paths = _make_search_paths(search_paths)
+        if search_paths != self.search_paths:
+            self.search_paths = search_paths
+            self._import_resolve_cache.clear()
+
     def get_obj_def(self, addr: AddrStr) -> ObjectDef:
         """Returns the ObjectDef for a given address."""
-        if addr not in self._output_cache:
-            file = address.get_file(addr)
-            file_ast = self.ast_getter(file)
-            obj = self.visitFile_input(file_ast)
-            assert isinstance(obj, ObjectDef)
-            # this operation puts it and it's children in the cache
-            self._register_obj_tree(obj, AddrStr(file), ())
+        # NOTE: these getters are hit far more often than they miss,
+        # so the hit path is a single lookup
+        obj = self._output_cache.get(addr)
+        if obj is not None:
+            return obj
+
+        file = address.get_file(addr)
+        file_ast = self.ast_getter(file)
+        obj = self.visitFile_input(file_ast)
+        assert isinstance(obj, ObjectDef)
+        # this operation puts it and it's children in the cache
+        self._register_obj_tree(obj, AddrStr(file), ())
         try:
             return self._output_cache[addr]
         except KeyError as ex:
@@ -570,7 +736,7 @@ class Scoop(BaseTranslator):
 
     def visitFile_input(self, ctx: ap.File_inputContext) -> ObjectDef:
         """Visit a file input and return it's object."""
-        locals_ = self.visit_iterable_helper(ctx.stmt())
+        locals_ = self.visitBlock(ctx)
 
         # FIXME: clean this up, and do much better name collision detection on it
         local_defs = {}
@@ -631,6 +797,32 @@ class Scoop(BaseTranslator):
 
         return KeyOptItem.from_kv(block_name, block_obj)
 
+    def _resolve_import(self, from_file: str, current_file: str) -> Optional[Path]:
+        """
+        Find the file an import refers to, searching next to the importing
+        file first. Successful lookups are cached, since the same files tend
+        to be imported from all over a project.
+        """
+        key = (from_file, current_file)
+        if key in self._import_resolve_cache:
+            return self._import_resolve_cache[key]
+
+        current_path = Path(current_file)
+        if current_path.is_file():
+            search_paths = chain((current_path.parent,), self.search_paths)
+        else:
+            search_paths = self.search_paths
+
+        # only resolve the path that's found, rather than every candidate
+        for search_path in search_paths:
+            candidate_path = search_path / from_file
+            if candidate_path.exists():
+                candidate_path = candidate_path.resolve()
+                self._import_resolve_cache[key] = candidate_path
+                return candidate_path
+
+        return None
+
     def visitImport_stmt(self, ctx: ap.Import_stmtContext) -> KeyOptMap:
         from_file: str = self.visitString(ctx.string())
         import_what_ref = self.visit_ref_helper(ctx.name_or_attr())
@@ -650,20 +842,10 @@ class Scoop(BaseTranslator):
             # import everything
             raise NotImplementedError("import *")
 
-        # get the current working directory
         current_file, _, _ = get_src_info_from_ctx(ctx)
-        current_file = Path(current_file)
-        if current_file.is_file():
-            search_paths = chain((current_file.parent,), self.search_paths)
-        else:
-            search_paths = self.search_paths
-
-        for search_path in search_paths:
-            candidate_path: Path = (search_path / from_file).resolve().absolute()
-            if candidate_path.exists():
-                break
-        else:
-            raise errors.AtoImportNotFoundError.from_ctx(  # pylint: disable=raise-missing-from
+        candidate_path = self._resolve_import(from_file, current_file)
+        if candidate_path is None:
+            raise errors.AtoImportNotFoundError.from_ctx(
                 ctx, f"File '{from_file}' not found."
             )
 
@@ -707,7 +889,7 @@ class Scoop(BaseTranslator):
         self, ctx: ap.Simple_stmtContext
     ) -> Iterable[_Sentinel | KeyOptItem]:
         """We have to be selective here to deal with the ignored children properly."""
-        if ctx.retype_stmt() or ctx.import_stmt():
+        if _simple_stmt_kind(ctx) in (ap.Retype_stmtContext, ap.Import_stmtContext):
             return super().visitSimple_stmt(ctx)
 
         return KeyOptMap.empty()
@@ -737,11 +919,13 @@ def lookup_obj_in_closure(context: ObjectDef, ref: Ref) -> AddrStr:
                 raise NotImplementedError
             return obj_lead.address
 
-        if ref in scope.imports:
-            return scope.imports[ref].obj_addr
+        import_ = scope.imports.get(ref)
+        if import_ is not None:
+            return import_.obj_addr
 
-    if ref in BUILTINS_BY_REF:
-        return BUILTINS_BY_REF[ref].address
+    builtin_addr = _BUILTIN_ADDR_BY_REF.get(ref)
+    if builtin_addr is not None:
+        return builtin_addr
 
     raise KeyError(ref)
 
@@ -767,15 +951,15 @@ class Dizzy(BaseTranslator):
 
     def get_obj_layer(self, addr: AddrStr) -> ObjectLayer:
         """Returns the ObjectLayer for a given address."""
-        if addr not in self._output_cache:
-            obj_def = self.obj_def_getter(addr)
-            obj = self.make_object(obj_def)
-            assert isinstance(obj, ObjectLayer)
-            self._output_cache[addr] = obj
-        try:
-            return self._output_cache[addr]
-        except KeyError as ex:
-            raise BlockNotFoundError(f"No block named $addr in {address.get_file(addr)}", addr=addr) from ex
+        obj = self._output_cache.get(addr)
+        if obj is not None:
+            return obj
+
+        obj_def = self.obj_def_getter(addr)
+        obj = self.make_object(obj_def)
+        assert isinstance(obj, ObjectLayer)
+        self._output_cache[addr] = obj
+        return obj
 
     def make_object(self, obj_def: ObjectDef) -> ObjectLayer:
         """Create an object layer from an object definition."""
@@ -834,7 +1018,7 @@ class Dizzy(BaseTranslator):
         self, ctx: ap.Simple_stmtContext
     ) -> Iterable[_Sentinel | KeyOptItem]:
         """We have to be selective here to deal with the ignored children properly."""
-        if ctx.assign_stmt():
+        if _simple_stmt_kind(ctx) is ap.Assign_stmtContext:
             return super().visitSimple_stmt(ctx)
 
         return (NOTHING,)
@@ -852,6 +1036,17 @@ def _translate_addr_key_errors(ctx: ParserRuleContext):
         ) from ex
 
 
+# the kinds of simple_stmt Lofty's visitSimple_stmt doesn't ignore
+_INSTANCE_STMT_KINDS = frozenset(
+    (
+        ap.Assign_stmtContext,
+        ap.Connect_stmtContext,
+        ap.Pindef_stmtContext,
+        ap.Signaldef_stmtContext,
+    )
+)
+
+
 class Lofty(BaseTranslator):
     """Lofty's job is to walk orthogonally down (or really up) the instance tree."""
 
@@ -866,6 +1061,14 @@ class Lofty(BaseTranslator):
         self._known_replacements: dict[AddrStr, AddrStr] = {}
         self.obj_layer_getter = obj_layer_getter
 
+        # the statements Lofty cares about in each block, in source order
+        self._instance_stmts: dict[ParserRuleContext, list[ap.Simple_stmtContext]] = {}
+
+        # pristine copies of the instance trees built from each object layer,
+        # keyed by the object layer's address, so identical instances can be
+        # copied instead of being rebuilt from the AST
+        self._instance_templates: dict[AddrStr, Instance] = {}
+
         self._instance_context_stack: list[AddrStr] = []
         self._obj_context_stack: list[AddrStr] = []
         super().__init__()
@@ -875,11 +1078,15 @@ class Lofty(BaseTranslator):
         if address.get_instance_section(addr):
             raise NotImplementedError
 
-        if addr not in self._output_cache:
-            obj_layer = self.obj_layer_getter(addr)
-            self.make_instance(addr, obj_layer)
-            assert isinstance(self._output_cache[addr], Instance)
-        return self._output_cache[addr]
+        instance = self._output_cache.get(addr)
+        if instance is not None:
+            return instance
+
+        obj_layer = self.obj_layer_getter(addr)
+        self.make_instance(addr, obj_layer)
+        instance = self._output_cache[addr]
+        assert isinstance(instance, Instance)
+        return instance
 
     @contextmanager
     def enter_instance(self, instance: AddrStr):
@@ -926,44 +1133,159 @@ class Lofty(BaseTranslator):
             for ref in commanded_replacements:
                 self._known_replacements.pop(ref)
 
+    def _has_replacements_under(self, addr: AddrStr) -> bool:
+        """Return whether any known replacements target descendants of addr."""
+        prefix = addr + "."
+        return any(
+            replaced_addr.startswith(prefix) for replaced_addr in self._known_replacements
+        )
+
+    @staticmethod
+    def _copy_instance_tree(
+        root: Instance, new_root_addr: AddrStr
+    ) -> list[Instance]:
+        """
+        Deep-copy an instance tree onto a new address,
+        returning the copies in the order they were made (root first).
+        """
+        old_root_addr_len = len(root.addr)
+        copies: dict[int, Instance] = {}
+        originals: list[Instance] = []
+
+        def _copy(instance: Instance) -> Instance:
+            copy = copies[id(instance)] = Instance(
+                src_ctx=instance.src_ctx,
+                addr=new_root_addr + instance.addr[old_root_addr_len:],
+                supers=instance.supers,
+                kind_mask=instance.kind_mask,
+                override_data=dict(instance.override_data),
+                data=dict(instance.data),
+            )
+            originals.append(instance)
+            copy.children = {
+                name: _copy(child) for name, child in instance.children.items()
+            }
+            return copy
+
+        _copy(root)
+
+        # links can point anywhere in the tree, so they're copied once all
+        # the instances exist
+        # most instances (eg. all the pins) have no links, and their copies
+        # already have an empty list of their own, so we skip those
+        for original in originals:
+            if not original.links:
+                continue
+            copies[id(original)].links = [
+                Link(
+                    src_ctx=link.src_ctx,
+                    parent=copies[id(link.parent)],
+                    source=copies[id(link.source)],
+                    target=copies[id(link.target)],
+                )
+                for link in original.links
+            ]
+
+        return [copies[id(original)] for original in originals]
+
     def make_instance(self, new_addr: AddrStr, super_obj: ObjectLayer) -> None:
         """Create an instance from a reference and a super object layer."""
         # FIXME: this should deal with name collisions and type collisions
 
-        supers = list(recurse(lambda x: x.super, super_obj))
-        override_data: dict[str, Any] = {}
-        data = ChainMap(override_data, *[s.data for s in supers])
+        # Instances of the same object are identical, other than their address,
+        # unless something further up the tree is replacing part of them.
+        # Root instances aren't templated because their addresses are shaped
+        # differently (they have no instance section).
+        use_template = bool(
+            self._instance_context_stack
+        ) and not self._has_replacements_under(new_addr)
+
+        if use_template and super_obj.address in self._instance_templates:
+            new_instances = self._copy_instance_tree(
+                self._instance_templates[super_obj.address], new_addr
+            )
+            for instance in new_instances:
+                self._output_cache[instance.addr] = instance
+            self._attach_to_parent(new_instances[0])
+            return
+
+        supers = super_obj.supers
+        # attribute reads far outnumber overrides, so rather than a ChainMap
+        # over the supers, flatten them into one dict up front
+        data: dict[str, Any] = {}
+        for super_ in reversed(supers):
+            data.update(super_.data)
         new_instance = self._output_cache[new_addr] = Instance(
             addr=new_addr,
-            override_data=override_data,
             data=data,
             supers=supers,
+            kind_mask=super_obj.kind_mask,
         )
 
         if self._instance_context_stack:
             # eg. we're not to the root
-            parent_addr = self._instance_context_stack[-1]
-            parent_instance = self._output_cache[parent_addr]
-            child_addr = address.get_name(new_addr)
-            parent_instance.children[child_addr] = new_instance
+            self._attach_to_parent(new_instance)
 
         try:
             with ExitStack() as stack:
                 stack.enter_context(self.enter_instance(new_addr))
                 stack.enter_context(self.apply_replacements_from_objs(supers))
                 for super_obj_ in reversed(supers):
-                    stack.enter_context(self.enter_obj(super_obj_.address))
                     if super_obj_.src_ctx is None:
                         # FIXME: this is currently the case for the builtins
+                        # there's nothing in them to visit, so don't bother
+                        # entering them either
                         continue
 
+                    stack.enter_context(self.enter_obj(super_obj_.address))
                     # visit the internals (eg. all the new statements, overrides etc...)
                     # of the things we're inheriting from
-                    self.visitBlock(super_obj_.src_ctx)
+                    self._visit_instance_stmts(super_obj_.src_ctx)
         except Exception:
             self._output_cache.pop(new_addr)
             raise
 
+        if use_template:
+            # copy it now, before anything further up the tree overrides its values
+            self._instance_templates[super_obj.address] = self._copy_instance_tree(
+                new_instance, new_addr
+            )[0]
+
+    def _attach_to_parent(self, instance: Instance) -> None:
+        """Add an instance to the children of the instance we're currently in."""
+        parent_addr = self._instance_context_stack[-1]
+        parent_instance = self._output_cache[parent_addr]
+        child_addr = address.get_name(instance.addr)
+        parent_instance.children[child_addr] = instance
+
+    def _get_instance_stmts(
+        self, ctx: ap.BlockContext | ap.File_inputContext
+    ) -> list[ap.Simple_stmtContext]:
+        """
+        Return the simple statements in a block that build up instances.
+
+        The same blocks are visited once for every instance made from them,
+        so rather than re-walking the stmt -> simple_stmts -> simple_stmt
+        layers of the tree each time, we flatten and filter them once.
+        """
+        if ctx not in self._instance_stmts:
+            self._instance_stmts[ctx] = [
+                stmt
+                for stmt in _iter_block_stmts(ctx)
+                if type(stmt) is ap.Simple_stmtContext
+                and _simple_stmt_kind(stmt) in _INSTANCE_STMT_KINDS
+            ]
+
+        return self._instance_stmts[ctx]
+
+    def _visit_instance_stmts(self, ctx: ap.BlockContext | ap.File_inputContext) -> None:
+        """Visit all the statements in a block that build up instances."""
+        for err_cltr, simple_stmt in errors.iter_through_errors(
+            self._get_instance_stmts(ctx)
+        ):
+            with err_cltr():
+                self.visitSimple_stmt(simple_stmt)
+
     def visitBlockdef(self, ctx: ap.BlockdefContext) -> _Sentinel:
         """Don't go down blockdefs, they're just for defining objects."""
         return NOTHING
@@ -978,8 +1300,8 @@ class Lofty(BaseTranslator):
 
         # Handle New Statements
         # FIXME: this is a giant fucking mess
-        if assignable_ctx.new_stmt():
-            new_stmt = assignable_ctx.new_stmt()
+        new_stmt = assignable_ctx.new_stmt()
+        if new_stmt:
             assert isinstance(new_stmt, ap.New_stmtContext)
             if len(assigned_ref) != 1:
                 raise errors.AtoError(
@@ -1030,6 +1352,7 @@ class Lofty(BaseTranslator):
             instance_assigned_to = self._output_cache[instance_addr_assigned_to]
 
         instance_assigned_to.override_data[assigned_name] = assigned_value
+        instance_assigned_to.data[assigned_name] = assigned_value
 
         return KeyOptMap.empty()
 
@@ -1050,13 +1373,12 @@ class Lofty(BaseTranslator):
 
         super_ = PIN if isinstance(ctx, ap.Pindef_stmtContext) else SIGNAL
 
-        override_data: dict[str, Any] = {}
         pin_or_signal = Instance(
             src_ctx=ctx,
             addr=new_addr,
-            supers=[super_],
-            override_data=override_data,
-            data=ChainMap(override_data, super_.data),
+            supers=super_.supers,
+            kind_mask=super_.kind_mask,
+            data=dict(super_.data),
         )
 
         self._output_cache[new_addr] = current_instance.children[ref[0]] = pin_or_signal
@@ -1098,8 +1420,11 @@ class Lofty(BaseTranslator):
 
     def visitConnectable(self, ctx: ap.ConnectableContext) -> AddrStr:
         """TODO:"""
-        if ctx.name_or_attr() or ctx.numerical_pin_ref():
-            ref = self.visit_ref_helper(ctx.name_or_attr() or ctx.numerical_pin_ref())
+        # each of these getters searches the context's children,
+        # so only ask for the reference once
+        ref_ctx = ctx.name_or_attr() or ctx.numerical_pin_ref()
+        if ref_ctx:
+            ref = self.visit_ref_helper(ref_ctx)
             return address.add_instances(self._instance_context_stack[-1], ref)
         elif ctx.pindef_stmt() or ctx.signaldef_stmt():
             return self.visitChildren(ctx)
@@ -1108,10 +1433,11 @@ class Lofty(BaseTranslator):
 
     def visitSimple_stmt(self, ctx: ap.Simple_stmtContext) -> KeyOptMap:
         """We have to be selective here to deal with the ignored children properly."""
-        if ctx.assign_stmt() or ctx.connect_stmt():
+        kind = _simple_stmt_kind(ctx)
+        if kind in (ap.Assign_stmtContext, ap.Connect_stmtContext):
             return super().visitSimple_stmt(ctx)
 
-        elif ctx.pindef_stmt() or ctx.signaldef_stmt():
+        elif kind in (ap.Pindef_stmtContext, ap.Signaldef_stmtContext):
             self.visitChildren(ctx)
 
         return KeyOptMap.empty()
@@ -1124,4 +1450,4 @@ lofty = Lofty(dizzy.get_obj_layer)
 
 def set_search_paths(paths: Iterable[Path | str]) -> None:
     """Set the search paths for the scoop."""
-    scoop.search_paths = paths
+    scoop.set_search_paths(paths)
@@ -1,9 +1,7 @@
-import itertools
 from collections import deque
 from typing import Callable, Hashable, Iterable, Optional, TypeVar
 
 import toolz
-import toolz.curried
 
 T = TypeVar("T")
 
@@ -22,23 +20,14 @@ def closest_common(
     # make a yardstick of the first iterable
     # this is a dict with the keys being the __key() of the items
     # and the values being the index of the item in the iterable
-    index_and_item = itertools.tee(enumerate(next(things)))
-    key_to_index_map = dict((get_key(item), i) for i, item in index_and_item[0])
-    index_to_item_map = dict((i, item) for i, item in index_and_item[1])
+    yardstick = list(next(things))
+    key_to_index_map = {get_key(item): i for i, item in enumerate(yardstick)}
 
     # set the index of the common item
     # this starts at 0 because if there's no other item we
     # just want to return the first item
     common_i = 0
-    max_i = len(key_to_index_map) - 1
-
-    def shortcut_if_common_is_already_root():
-        if not validate_common_root:
-            if common_i == max_i:
-                # return early in the case we're already at the root
-                return index_to_item_map[common_i]
-
-    shortcut_if_common_is_already_root()
+    max_i = len(yardstick) - 1
 
     for thing in things:
         for item in thing:
@@ -49,13 +38,16 @@ def closest_common(
                 item_common_i = key_to_index_map[key]
                 if item_common_i > common_i:
                     common_i = item_common_i
-                    shortcut_if_common_is_already_root()
                 break
         else:
             # if we didn't find a common item, then we raise an error
             raise ValueError("No common item found.")
 
-    return index_to_item_map[common_i]
+        if common_i == max_i and not validate_common_root:
+            # stop early once this thing has confirmed we're at the root
+            break
+
+    return yardstick[common_i]
 
 
 # NOTE:
@@ -99,7 +91,9 @@ def recurse(
     start: T,
 ) -> Iterable[T]:
     """Recursively yield items, optionally including the starting item and its children."""
-    yield start
-    next_item = get_next(start)
-    if next_item is not None:
-        yield from recurse(get_next, next_item)
+    # NOTE: this is done with a loop rather than actual recursion, so each
+    # step doesn't cost a new generator and a chain of "yield from"s
+    next_item = start
+    while next_item is not None:
+        yield next_item
+        next_item = get_next(next_item)
@@ -1,32 +1,47 @@
+from functools import cache
 from typing import Any, Iterable, Optional, Callable
 
-from atopile.front_end import lofty, ObjectLayer
+from atopile.front_end import BUILTIN_KIND_BITS, Instance, lofty, ObjectLayer
 from atopile import address
 from atopile.address import AddrStr
 
 
 def get_children(addr: str) -> Iterable[AddrStr]:
-    root_addr = address.get_entry(addr)
-    root_instance = lofty.get_instance_tree(root_addr)
-    ref_str = address.get_instance_section(addr)
+    for child in _get_instance(addr).children.values():
+        yield child.addr
 
-    nested_instance = root_instance
-    if ref_str:
-        for child_ref in ref_str.split("."):
-            nested_instance = nested_instance.children[child_ref]
 
-    for child in nested_instance.children.values():
-        yield child.addr
+def _get_instance(addr: AddrStr) -> Instance:
+    """
+    Return the instance at the given address, building its tree if need be
+    """
+    # Once a root's tree is built, every instance in it is in lofty's cache,
+    # so only go through the root on a miss
+    try:
+        return lofty._output_cache[addr]
+    except KeyError:
+        pass
+
+    # FIXME: this is a hack around the fact that the getter won't currently return a subtree
+    lofty.get_instance_tree(address.get_entry(addr))
+    return lofty._output_cache[addr]
+
+
+def get_pins(addr: str) -> list[AddrStr]:
+    """Return the addresses of the pins directly under the given address"""
+    pin_bit = BUILTIN_KIND_BITS["<Built-in>:Pin"]
+    return [
+        child.addr
+        for child in _get_instance(addr).children.values()
+        if child.kind_mask & pin_bit
+    ]
 
 
 def get_data_dict(addr: str) -> dict[str, Any]:
     """
     Return the data at the given address
     """
-    # FIXME: this is a hack around the fact that the getter won't currently return a subtree
-    root_addr = address.get_entry(addr)
-    lofty.get_instance_tree(root_addr)
-    return lofty._output_cache[addr].data
+    return _get_instance(addr).data
 
 
 def get_lock_data_dict(addr: str) -> dict[str, Any]:
@@ -37,13 +52,54 @@ def get_lock_data_dict(addr: str) -> dict[str, Any]:
     return {}
 
 
+def _iter_descendant_instances(addr: str) -> Iterable[Instance]:
+    """
+    Return the instances under (and including) the given address, in depth-first order
+    """
+    # NOTE: this is done with an explicit stack rather than recursion, so deep
+    # trees don't cost a chain of nested generators (or hit the recursion limit)
+    # We walk the instances themselves, rather than their addresses, so each
+    # child is read straight off its parent instead of being looked up again
+    stack = [(_get_instance(addr), False)]
+    while stack:
+        instance, children_done = stack.pop()
+        if children_done:
+            yield instance
+            continue
+
+        stack.append((instance, True))
+        stack.extend((child, False) for child in reversed(instance.children.values()))
+
+
 def all_descendants(addr: str) -> Iterable[str]:
     """
     Return a list of addresses in depth-first order
     """
-    for child in get_children(addr):
-        yield from all_descendants(child)
-    yield addr
+    return (instance.addr for instance in _iter_descendant_instances(addr))
+
+
+def iter_components(addr: str) -> Iterable[str]:
+    """
+    Return the addresses of the components under the given address, in depth-first order
+    """
+    # NOTE: this is the same as filtering all_descendants with match_components,
+    # but with the check inlined, since it's run over every instance in the tree
+    component_bit = BUILTIN_KIND_BITS["<Built-in>:Component"]
+    return (
+        instance.addr
+        for instance in _iter_descendant_instances(addr)
+        if instance.kind_mask & component_bit
+    )
+
+
+# The netlist, BoM and designators all need every component under the same
+# entry, so we only walk the instance tree for them once
+@cache
+def get_all_components(addr: str) -> tuple[str, ...]:
+    """
+    Return the addresses of all the components under the given address
+    """
+    return tuple(iter_components(addr))
 
 
 def _make_dumb_matcher(pass_list: Iterable[str]) -> Callable[[str], bool]:
@@ -52,28 +108,31 @@ def _make_dumb_matcher(pass_list: Iterable[str]) -> Callable[[str], bool]:
     """
 
     # TODO: write me irl
+    instances = lofty._output_cache
+
+    # NOTE: only built-ins can be matched, since that's all instances are tagged with
+    pass_mask = 0
+    for pass_addr in pass_list:
+        pass_mask |= BUILTIN_KIND_BITS[pass_addr]
+
     def _filter(addr: AddrStr) -> bool:
-        instance = lofty._output_cache[addr]
-        for super_ in reversed(instance.supers):
-            if super_.address in pass_list:
-                return True
-        return False
+        return bool(instances[addr].kind_mask & pass_mask)
 
     return _filter
 
 
-def _any_super_match(super: str) -> Callable[[str], bool]:
+def _any_super_match(super_addr: str) -> Callable[[str], bool]:
     """
     Return a filter that checks if the super is in the instance
     """
 
     # TODO: write me irl
+    instances = lofty._output_cache
+
     def _filter(addr: AddrStr) -> bool:
-        instance = lofty._output_cache[addr]
-        for super_ in reversed(instance.supers):
+        for super_ in reversed(instances[addr].supers):
             if super_.super is not None:
-                print(super_.super)
-                if super in super_.super:
+                if super_addr in super_.super:
                     return True
         return False
 
@@ -83,13 +142,14 @@ def _any_super_match(super: str) -> Callable[[str], bool]:
 match_components = _make_dumb_matcher(["<Built-in>:Component"])
 match_modules = _make_dumb_matcher(["<Built-in>:Module"])
 match_signals = _make_dumb_matcher(["<Built-in>:Signal"])
-match_pins = _make_dumb_matcher("<Built-in>:Pin")
+match_pins = _make_dumb_matcher(["<Built-in>:Pin"])
 match_pins_and_signals = _make_dumb_matcher(["<Built-in>:Pin", "<Built-in>:Signal"])
 match_interfaces = _make_dumb_matcher(["<Built-in>:Interface"])
 match_sentinels = _make_dumb_matcher(
     [
         "<Built-in>:Component",
-        "<Built-in>:Module" "<Built-in>:Signal",
+        "<Built-in>:Module",
+        "<Built-in>:Signal",
         "<Built-in>:Pin",
         "<Built-in>:Interface",
     ]
@@ -104,28 +164,43 @@ def get_next_super(addr: AddrStr) -> ObjectLayer:
     return get_supers_list(addr)[0]
 
 
+# Addresses are immutable strings, so their parents never change, and
+# the same parents are asked for over and over (eg. once per pin on a net)
+@cache
 def get_parent(addr: str) -> Optional[str]:
     """
     Return the parent of the given address
     """
     # TODO: write me irl
-    if "::" not in addr:
+    root_path, sep, instance_path = addr.rpartition("::")
+    if not sep:
         return None
-    root_path, instance_path = addr.rsplit("::", 1)
     if "." in instance_path:
-        return addr.rsplit(".", 1)[0]
+        return addr.rpartition(".")[0]
     elif instance_path:
         return root_path
 
 
+@cache
+def _get_parent_chain(addr: str) -> tuple[str, ...]:
+    """Return the parents of the given address, nearest first"""
+    parent = get_parent(addr)
+    if not parent:
+        return ()
+    # siblings share their parents' chains, so each chain is only built once
+    return (parent,) + _get_parent_chain(parent)
+
+
 def iter_parents(addr: str) -> Iterable[str]:
     """Iterate over the parents of the given address"""
-    while addr := get_parent(addr):
-        yield addr
+    return iter(_get_parent_chain(addr))
 
 
 def get_links(addr: AddrStr) -> Iterable[tuple[AddrStr, AddrStr]]:
     """Return the links associated with an instance"""
-    links = lofty._output_cache[addr].links
-    for link in links:
-        yield (link.source.addr, link.target.addr)
+    # most instances have no links at all, so pull them out in one go
+    # rather than starting up a generator for each instance
+    return [
+        (link.source.addr, link.target.addr)
+        for link in lofty._output_cache[addr].links
+    ]
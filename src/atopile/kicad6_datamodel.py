@@ -3,7 +3,9 @@ from typing import List, Optional
 from attrs import define, field
 
 
-@define
+# NOTE: fields, pins and nodes are made by the thousand for big designs and
+# nothing holds weak references to them, so they skip the __weakref__ slot
+@define(weakref_slot=False)
 class KicadField:
     """KV pair"""
 
@@ -11,7 +13,7 @@ class KicadField:
     value: str  # eg 10 Ohms
 
 
-@define
+@define(weakref_slot=False)
 class KicadPin:
     """
     eg. (pin (num "1") (name "") (type "passive"))
@@ -86,7 +88,7 @@ class KicadComponent:
     sheetpath: KicadSheetpath = field(factory=KicadSheetpath)
 
 
-@define
+@define(weakref_slot=False)
 class KicadNode:
     """
     eg. (node (ref "R1") (pin "1") (pintype "passive"))
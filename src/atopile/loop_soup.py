@@ -18,6 +18,19 @@ class LoopItem(collections.abc.Iterable[T]):
         self.represents = represents
         self.prev = self
         self.next = self
+        # union-find bookkeeping, so we can tell whether two items are
+        # already in the same loop without walking the whole loop
+        self._root = self
+        self._size = 1
+
+    def _find_root(self) -> "LoopItem[T]":
+        """Find the item representing this item's loop"""
+        item = self
+        while item._root is not item:
+            # path halving keeps these chains short
+            item._root = item._root._root
+            item = item._root
+        return item
 
     def iter_loop(self, limit: Optional[int] = None) -> Iterator["LoopItem[T]"]:
         """Iterate over the loop"""
@@ -48,10 +61,18 @@ class LoopItem(collections.abc.Iterable[T]):
     def join(a: "LoopItem", b: "LoopItem") -> None:
         """Join two loops together"""
 
-        # if they're the same, do nothing
-        if a is b:
+        # if they're already in the same loop, do nothing
+        a_root = a._find_root()
+        b_root = b._find_root()
+        if a_root is b_root:
             return
 
+        # merge the smaller group into the larger one
+        if a_root._size < b_root._size:
+            a_root, b_root = b_root, a_root
+        b_root._root = a_root
+        a_root._size += b_root._size
+
         # if they're both lonely, make them friends
         if a.next is a and b.next is b:
             assert a.prev is a
@@ -77,17 +98,15 @@ class LoopItem(collections.abc.Iterable[T]):
             b.next = old_next
             old_next.prev = b
 
-        # if neither is lonely, check if they are already joined
-        # If not, join them
+        # if neither is lonely, we know they aren't already joined
+        # from their roots above, so join them
         else:
-            a_loop_items = list(a.iter_loop())
-            if b not in a_loop_items:
-                a_old_next = a.next
-                b_old_prev = b.prev
-                a.next = b
-                b.prev = a
-                b_old_prev.next = a_old_next
-                a_old_next.prev = b_old_prev
+            a_old_next = a.next
+            b_old_prev = b.prev
+            a.next = b
+            b.prev = a
+            b_old_prev.next = a_old_next
+            a_old_next.prev = b_old_prev
 
 
 def _simple_return(x: T) -> T:
@@ -122,14 +141,15 @@ class LoopSoup:
 
     def groups(self) -> Iterator[tuple[T]]:
         """Return an iterator of groups of things that are connected together"""
-        seen = set()
+        # track the loop items themselves, so we don't have to re-key every value
+        seen: set[LoopItem[T]] = set()
 
-        for k, v in self._map.items():
-            if k in seen:
+        for loop_item in self._map.values():
+            if loop_item in seen:
                 continue
 
             # we can't do this bit lazily because we need to know
-            # which values we would see if we went through the whole group
-            values = tuple(v.iter_values())
-            seen.update(self.key_func(i) for i in values)
-            yield values
+            # which items we would see if we went through the whole group
+            items = tuple(loop_item.iter_loop())
+            seen.update(items)
+            yield tuple(item.represents for item in items)
@@ -1,19 +1,19 @@
 import hashlib
-import uuid
+import os
+from collections import defaultdict
+from functools import cache
 from pathlib import Path
 from typing import Optional
 
-from jinja2 import Environment, FileSystemLoader, StrictUndefined
-from toolz import groupby
+from jinja2 import Environment, FileSystemLoader, StrictUndefined, Template
 
 from atopile import components, errors, nets
 from atopile.address import AddrStr, get_name, get_relative_addr_str
 from atopile.instance_methods import (
-    all_descendants,
-    get_children,
+    get_all_components,
     get_next_super,
     get_parent,
-    match_components,
+    get_pins,
     match_pins,
 )
 from atopile.kicad6_datamodel import (
@@ -37,11 +37,12 @@ _get_value = errors.downgrade(
 )
 
 
+@cache
 def generate_uid_from_path(path: str) -> str:
     """Spits out a uuid in hex from a string"""
-    path_as_bytes = path.encode("utf-8")
-    hashed_path = hashlib.blake2b(path_as_bytes, digest_size=16).digest()
-    return str(uuid.UUID(bytes=hashed_path))
+    # formatted like str(uuid.UUID(bytes=...)), without the round-trip through UUID
+    h = hashlib.blake2b(path.encode("utf-8"), digest_size=16).hexdigest()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
 
 
 class NetlistBuilder:
@@ -60,8 +61,7 @@ class NetlistBuilder:
 
     def make_libpart(self, comp_addr: AddrStr) -> KicadLibpart:
         """Make a KiCAD libpart object from a representative instance object."""
-        model_pins = filter(match_pins, get_children(comp_addr))
-        pins = [self.make_kicad_pin(pin) for pin in model_pins]
+        pins = [self.make_kicad_pin(pin) for pin in get_pins(comp_addr)]
         # def _get_origin_of_instance(instance: Instance) -> Object:
         #     return instance.origin
 
@@ -79,22 +79,33 @@ class NetlistBuilder:
         )
         return constructed_libpart
 
-    def make_node(self, node_addr: AddrStr) -> KicadNode:
+    def make_node(self, node_addr: AddrStr, ref: Optional[str] = None) -> KicadNode:
         """Make a KiCAD node object from a representative instance object."""
-        parent = get_parent(node_addr)
+        if ref is None:
+            ref = components.get_designator(get_parent(node_addr))
         node = KicadNode(
             pin=get_name(node_addr),  # eg. 1
-            ref=components.get_designator(parent),  # eg. R1
+            ref=ref,  # eg. R1
             pintype="stereo",
         )
         return node
 
     def make_net(self, code, net_name, net_list) -> KicadNet:
         """Make a KiCAD net object from a representative instance object."""
+        # many of a net's pins tend to be on the same component,
+        # so only look up each component's designator once
+        refs: dict[AddrStr, str] = {}
+        nodes = []
+        for pin in filter(match_pins, net_list):
+            parent = get_parent(pin)
+            if parent not in refs:
+                refs[parent] = components.get_designator(parent)
+            nodes.append(self.make_node(pin, refs[parent]))
+
         net = KicadNet(
             code=code,
             name=net_name,
-            nodes=[self.make_node(pin) for pin in filter(match_pins, net_list)],
+            nodes=nodes,
         )
         return net
 
@@ -103,11 +114,13 @@ class NetlistBuilder:
     ) -> KicadComponent:
         """Make a KiCAD component object from a representative instance object."""
 
+        tstamp = generate_uid_from_path(str(comp_addr))
+
         # TODO: improve this
         sheetpath = (
             KicadSheetpath(  # That's not actually what we want. Will have to fix
                 names=comp_addr,  # TODO: going to have to strip the comp name from this
-                tstamps=generate_uid_from_path(str(comp_addr)),
+                tstamps=tstamp,
             )
         )
 
@@ -117,7 +130,7 @@ class NetlistBuilder:
             value=_get_value(comp_addr),
             footprint=components.get_footprint(comp_addr),
             libsource=libsource,
-            tstamp=generate_uid_from_path(str(comp_addr)),
+            tstamp=tstamp,
             fields=[],
             sheetpath=sheetpath,
             src_path=comp_addr,
@@ -128,20 +141,19 @@ class NetlistBuilder:
         """Build a netlist from an instance"""
         self.netlist = KicadNetlist()
 
-        # We need to cast this to a list, otherwise we're trying to reuse a generator
-        all_components = list(filter(match_components, all_descendants(root)))
+        all_components = get_all_components(root)
 
-        # first check that all the components have a footprint
+        # group the components by their footprint - because that seems
+        # to be the only distinguishing feature KiCAD cares about
+        # while we're at it, check that all the components have a footprint
         # otherwise we can't continue the netlist build
+        components_by_footprint: dict[str, list[AddrStr]] = defaultdict(list)
         for cltr, component in errors.iter_through_errors(all_components):
             with cltr():
-                components.get_footprint(component)
+                footprint = components.get_footprint(component)
+                components_by_footprint[footprint].append(component)
 
-        # group the components by their footprint - because that seems
-        # to be the only distinguishing feature KiCAD cares about
-        for footprint, group_components in groupby(
-            components.get_footprint, all_components
-        ).items():
+        for footprint, group_components in components_by_footprint.items():
             libsource = self._libparts[footprint] = self.make_libpart(
                 group_components[0]
             )
@@ -161,16 +173,37 @@ class NetlistBuilder:
         return self.netlist
 
 
-def get_netlist_as_str(root: AddrStr) -> str:
-    """Return the netlist as a string."""
+# Number of template chunks to join per write, and the file buffer size
+_STREAM_BUFFER_SIZE = 64
+_FILE_BUFFER_SIZE = 128 * 1024
+
+
+def write_netlist(root: AddrStr, path: Path) -> None:
+    """Build the netlist and stream it straight to a file."""
+    # Build before opening the file, so a failed build doesn't truncate
+    # the previous output or hold the file open while we compute
     builder = NetlistBuilder()
     netlist = builder.build(root)
 
+    stream = _get_netlist_template().stream(nl=netlist)
+    stream.enable_buffering(_STREAM_BUFFER_SIZE)
+
+    # Render into a sibling file and swap it in, so a failed render
+    # doesn't leave a truncated netlist behind either
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        with tmp_path.open("w", encoding="utf-8", buffering=_FILE_BUFFER_SIZE) as f:
+            stream.dump(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+@cache
+def _get_netlist_template() -> Template:
+    """Load and compile the netlist template, once."""
     env = Environment(
         loader=FileSystemLoader(Path(__file__).parent), undefined=StrictUndefined
     )
-
-    # Create the complete netlist
-    template = env.get_template("kicad6.j2")
-    netlist_str = template.render(nl=netlist)
-    return netlist_str
+    return env.get_template("kicad6.j2")
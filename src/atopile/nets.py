@@ -1,6 +1,5 @@
 from collections import defaultdict
 from typing import Iterable, Optional
-from toolz import groupby
 from attr import define
 
 from atopile import address
@@ -25,16 +24,20 @@ def get_nets(root: AddrStr) -> Iterable[Iterable[str]]:
     """Find all the nets under a given root."""
     net_soup = LoopSoup()
     for addr in all_descendants(root):
+        # pins and signals are leaves; they never hold links of their own
         if match_pins_and_signals(addr):
             net_soup.add(addr)
+            continue
+
         for source, target in get_links(addr):
-            if match_interfaces(source) and match_interfaces(target):
+            source_is_interface = match_interfaces(source)
+            if source_is_interface and match_interfaces(target):
                 for int_pin in get_children(source):
                     if match_pins_and_signals(int_pin):
                         net_soup.join(int_pin, add_instance(target, get_name(int_pin)))
                     else:
                         raise NotImplementedError
-            elif match_interfaces(source) or match_interfaces(source):
+            elif source_is_interface or match_interfaces(target):
                 raise NotImplementedError
             else:
                 net_soup.join(source, target)
@@ -105,7 +108,9 @@ def _find_net_names(nets: Iterable[Iterable[str]]) -> dict[str, list[str]]:
 
 def _find_conflicts(nets: Iterable[_Net]) -> Iterable[Iterable[_Net]]:
     """"""
-    nets_grouped_by_name = groupby(lambda net: net.get_name(), nets)
+    nets_grouped_by_name: dict[str, list[_Net]] = defaultdict(list)
+    for net in nets:
+        nets_grouped_by_name[net.get_name()].append(net)
     for nets in nets_grouped_by_name.values():
         if len(nets) > 1:
             yield nets
@@ -150,11 +155,6 @@ class NetFinder:
 
         if entry not in self.net_name_to_nodes_map:
             self.net_name_to_nodes_map[entry] = _find_net_names(get_nets(entry))
-            self.node_to_net_name[entry] = {
-                node: net_name
-                for net_name, nodes in self.net_name_to_nodes_map[entry].items()
-                for node in nodes
-            }
 
         return self.net_name_to_nodes_map[entry]
 
@@ -162,7 +162,12 @@ class NetFinder:
         """Get the net name for a given node."""
         entry = address.get_entry(node)
         if entry not in self.node_to_net_name:
-            self.get_nets_by_name(entry)
+            # only build the reverse map if someone asks for it,
+            # filling it a whole net at a time
+            node_to_net_name: dict[AddrStr, str] = {}
+            for net_name, nodes in self.get_nets_by_name(entry).items():
+                node_to_net_name.update(dict.fromkeys(nodes, net_name))
+            self.node_to_net_name[entry] = node_to_net_name
 
         return self.node_to_net_name[entry][node]
 
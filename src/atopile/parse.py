@@ -95,8 +95,11 @@ class FileParser:
         self, src_path: str | Path
     ) -> AtopileParser.File_inputContext:
         """Get the AST from a file."""
+        # NOTE: addresses give us the path as a string, so normalise it before
+        # looking it up, otherwise string lookups never hit the cache and the
+        # file is re-parsed into a whole new tree each time
+        src_path = Path(src_path)
         if src_path not in self.cache:
-            src_path = Path(src_path)
             if not src_path.exists():
                 raise AtoFileNotFoundError(str(src_path))
             self.cache[src_path] = parse_file(src_path)
@@ -0,0 +1,45 @@
+from atopile import address
+
+
+def test_get_file():
+    assert address.get_file("file.ato:Entry.Path::instance.path") == "file.ato"
+    assert address.get_file("file.ato") == "file.ato"
+
+
+def test_get_entry():
+    assert address.get_entry("file.ato:Entry.Path::instance.path") == "file.ato:Entry.Path"
+    assert address.get_entry("file.ato:Entry.Path") == "file.ato:Entry.Path"
+
+
+def test_get_entry_section():
+    assert address.get_entry_section("file.ato:Entry.Path::instance.path") == "Entry.Path"
+    assert address.get_entry_section("file.ato") is None
+
+
+def test_get_instance_section():
+    assert address.get_instance_section("file.ato:Entry.Path::instance.path") == "instance.path"
+    assert address.get_instance_section("file.ato:Entry.Path") is None
+
+
+def test_get_name():
+    assert address.get_name("file.ato:Entry.Path::instance.path") == "path"
+    assert address.get_name("file.ato:Entry") == "Entry"
+
+
+def test_add_instances():
+    assert (
+        address.add_instances("file.ato:Entry", ["a", "b", "c"])
+        == "file.ato:Entry::a.b.c"
+    )
+    assert address.add_instances("file.ato:Entry::a", ["b"]) == "file.ato:Entry::a.b"
+
+
+def test_add_entries():
+    assert address.add_entries("file.ato", ["A", "B"]) == "file.ato:A.B"
+
+
+def test_built_addresses_match_scanned_sections():
+    entry = address.add_entries("file.ato", ["A", "B"])
+    instance = address.add_instances(entry, ["c", "d"])
+    for addr in (entry, instance):
+        assert address._split_sections(addr) == address._scan_sections(addr)
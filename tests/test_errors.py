@@ -32,3 +32,17 @@ def test_iter_through_errors():
 
     else:
         raise AssertionError("Expected an ExceptionGroup to be raised")
+
+
+def test_iter_through_errors_passes_other_errors():
+    with pytest.raises(ExceptionGroup) as ex_info:
+        for cltr, i in iter_through_errors(range(2)):
+            with cltr():
+                raise ExceptionGroup(
+                    "mixed", [AtoError(f"test error {i}"), ValueError(i)]
+                )
+
+    # the first non-ato error stops iteration and is raised on its own
+    assert ex_info.value.message == "mixed"
+    assert len(ex_info.value.exceptions) == 1
+    assert isinstance(ex_info.value.exceptions[0], ValueError)
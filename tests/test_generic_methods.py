@@ -1,5 +1,5 @@
 import pytest
-from atopile.generic_methods import dfs_postorder, bfs
+from atopile.generic_methods import closest_common, dfs_postorder, bfs, recurse
 
 
 class Node:
@@ -46,3 +46,23 @@ def test_bfs(tree: tuple[Node]):
 def test_dfs_postorder(tree: tuple[Node]):
     a, b, c, d, e, f, g, h = tree
     assert list(dfs_postorder(lambda n: n.children, a)) == [e, f, b, g, h, c, d, a]
+
+
+def test_recurse():
+    assert list(recurse(lambda x: x - 1 if x > 0 else None, 3)) == [3, 2, 1, 0]
+
+
+def test_closest_common():
+    assert closest_common([[3, 2, 1, 0], [4, 2, 1, 0], [5, 1, 0]]) == 1
+    assert closest_common([[3, 2, 1, 0]]) == 3
+
+    with pytest.raises(ValueError):
+        closest_common([[3, 2, 1, 0], [4, 5]])
+
+    with pytest.raises(ValueError):
+        closest_common([[1], [2]])
+
+    # once the common item is the root, the rest needn't be checked
+    assert closest_common([[1, 0], [2, 0], [3]]) == 0
+    with pytest.raises(ValueError):
+        closest_common([[1, 0], [2, 0], [3]], validate_common_root=True)
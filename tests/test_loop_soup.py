@@ -88,6 +88,23 @@ def test_joining_loop_onto_itself():
     assert set(itself1) == set(itself2) == set(itself3) == set(itself4)
 
 
+def test_rejoining_merged_loops():
+    many1 = LoopItem(1)
+    many2 = LoopItem(5)
+    for i in range(2, 5):
+        LoopItem.join(many1, LoopItem(i))
+        LoopItem.join(many2, LoopItem(i + 4))
+
+    LoopItem.join(many1, many2)
+    before = list(many1)
+
+    # joining any two members of the same loop again is a no-op
+    LoopItem.join(many2.next, many1.prev)
+
+    assert list(many1) == before
+    assert set(many1) == set(range(1, 9))
+
+
 def test_limit():
     loop = LoopItem(1)
     for i in range(2, 10):
@@ -0,0 +1,25 @@
+from pathlib import Path
+
+import pytest
+
+from atopile import nets
+from atopile.front_end import set_search_paths
+
+
+@pytest.mark.parametrize("link", ["a ~ power", "power ~ a"])
+def test_signal_to_interface_link(tmp_path: Path, link: str):
+    src_path = tmp_path / "main.ato"
+    src_path.write_text(
+        "interface Power:\n"
+        "    signal vcc\n"
+        "    signal gnd\n"
+        "\n"
+        "module Top:\n"
+        "    signal a\n"
+        "    power = new Power\n"
+        f"    {link}\n"
+    )
+    set_search_paths([tmp_path])
+
+    with pytest.raises(NotImplementedError):
+        nets.get_nets(f"{src_path.resolve()}:Top")